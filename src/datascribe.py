@@ -1,12 +1,43 @@
 import click
+import importlib
 import os
+import shlex
 from utils.config import set_working_directory, get_working_directory, save_config
 from utils.helper import resolve_path
-from modules import metadata, filesystem, multimedia, log_extraction
 import utils.tools_availability as ta
 import subprocess
 
-@click.group(invoke_without_command=True)
+# Analysis modules, imported only when their command group is actually used
+MODULE_COMMANDS = {
+    "filesystem": "modules.filesystem",
+    "metadata": "modules.metadata",
+    "multimedia": "modules.multimedia",
+    "log-extraction": "modules.log_extraction",
+}
+
+
+class LazyModuleGroup(click.Group):
+    """
+    Click group that imports analysis modules on demand.
+
+    Commands like --get-workdir or check-tools no longer pay the import cost
+    of every analysis module on startup.
+    """
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(MODULE_COMMANDS))
+
+    def get_command(self, ctx, name):
+        command = super().get_command(ctx, name)
+        if command is not None:
+            return command
+        module_path = MODULE_COMMANDS.get(name)
+        if module_path is None:
+            return None
+        return importlib.import_module(module_path).module
+
+
+@click.group(cls=LazyModuleGroup, invoke_without_command=True)
 @click.option("--get-workdir", is_flag=True, help="Print the current working directory.")
 @click.option("--set-workdir", type=click.Path(), help="Set the working directory.")
 @click.pass_context
@@ -14,18 +45,16 @@ def cli(ctx, get_workdir, set_workdir):
     """
     DataScribe CLI - Modular forensic analysis tool.
     """
-    # Load the working directory into the context
     ctx.ensure_object(dict)  # Ensure ctx.obj exists
-    ctx.obj["workdir"] = get_working_directory()
 
     if get_workdir:
         # Print the current working directory
-        click.echo(f"Current working directory: {ctx.obj['workdir']}")
+        click.echo(f"Current working directory: {get_working_directory()}")
         ctx.exit(0)
 
     if set_workdir:
         # Resolve the path using the helper function
-        resolved_path = resolve_path(ctx.obj["workdir"],set_workdir)
+        resolved_path = resolve_path(get_working_directory(),set_workdir)
         try:
             if os.path.exists(resolved_path) and os.path.isdir(resolved_path):
                 save_config({"workdir": resolved_path})
@@ -38,6 +67,9 @@ def cli(ctx, get_workdir, set_workdir):
     # If no options or commands are provided, print help
     if not ctx.invoked_subcommand:
         click.echo(ctx.get_help())
+    else:
+        # Load the working directory only when a command will actually use it
+        ctx.obj["workdir"] = get_working_directory()
 
 
 @cli.command()
@@ -56,11 +88,39 @@ def check_tools(install):
             click.echo(instalation_message)
     else:
         click.echo("No missing tools found.")
-# Dynamically register module commands
-cli.add_command(filesystem.module, name="filesystem")
-cli.add_command(metadata.module, name="metadata")
-cli.add_command(multimedia.module, name="multimedia")
-cli.add_command(log_extraction.module, name="log-extraction")
+
+
+@cli.command()
+def shell():
+    """
+    Run an interactive shell that reuses one warm process for many commands.
+
+    Repeated CLI invocations pay interpreter startup and module imports every
+    time; the shell pays them once and dispatches each line in-process.
+    """
+    click.echo("DataScribe shell. Type 'exit' or 'quit' to leave.")
+    while True:
+        try:
+            line = click.prompt("datascribe", prompt_suffix="> ")
+        except (click.Abort, EOFError):
+            break
+
+        line = line.strip()
+        if not line:
+            continue
+        if line in ("exit", "quit"):
+            break
+
+        try:
+            cli.main(shlex.split(line), standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except SystemExit:
+            # Commands call sys.exit()/ctx.exit() on errors; keep the shell alive
+            pass
+        except Exception as e:
+            click.echo(f"Error: {e}")
+
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -1,10 +1,29 @@
 import json
+import re
+import shutil
 import sys
 import os
 import click
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from utils.helper import check_path_type,resolve_path, run_command, parse_size_to_string
 
+# Matches the leading partition number column of `parted ... print` output
+_PART_RE = re.compile(r"^\s*(\d+)\s", re.MULTILINE)
+
+# Output directories already created during this process
+_MKDIR_CACHE = set()
+
+# Argv prefixes for the disk analysis tools; the image path is appended,
+# except for parted whose subcommand follows the path
+_DISK_TOOL_ARGV = {
+    "fdisk": ("fdisk", "-l"),
+    "parted": ("parted",),
+    "file": ("file",),
+    "disktype": ("disktype",),
+    "ewfinfo": ("ewfinfo",),
+}
+
 
 @click.group()
 def module():
@@ -37,13 +56,14 @@ def directory_size(ctx, dir_path, depth, include_files):
     try:
         entries = _list_directory_sizes(dir_path, depth, include_files)
 
-        click.echo(f"Directory size summary for '{dir_path}':")
-        for path, size in entries:
-            if isinstance(size, int):  # Valid size
-                size_str = parse_size_to_string(size)
-                click.echo(f"- {path}: {size_str}")
-            else:  # Error case
-                click.echo(f"- {path}: {size}")
+        # Build the report once and emit it with a single write instead of
+        # one write syscall per entry
+        lines = [f"Directory size summary for '{dir_path}':"]
+        lines.extend(
+            f"- {path}: {parse_size_to_string(size) if isinstance(size, int) else size}"
+            for path, size in entries
+        )
+        click.echo("\n".join(lines))
     except Exception as e:
         click.echo(f"Error: {e}")
 
@@ -134,9 +154,13 @@ def disk_image_info(ctx, file_path, tool):
 
 
     try:
-        for t in tools:
-            output = _run_disk_tool(t, file_path)
-            click.echo(f"\n{t.upper()} Output:\n{'=' * 40}\n{output}\n")
+        # The tools are independent and read-only, so run them concurrently.
+        # Collect futures in list order to keep the printed output stable.
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            futures = [executor.submit(_run_disk_tool, t, file_path) for t in tools]
+            for t, future in zip(tools, futures):
+                output = future.result()
+                click.echo(f"\n{t.upper()} Output:\n{'=' * 40}\n{output}\n")
     except Exception as e:
         click.echo(f"Error: {e}")
 
@@ -190,33 +214,73 @@ def _list_directory_sizes(dir_path, depth, include_files):
     """
     entries = []
     try:
-        if os.path.isdir(dir_path):
-
-            result = run_command(["du", "--bytes", "--max-depth", str(depth), dir_path])
-            # Parse the output to: <size> <path>
-            for line in result.splitlines():
-                size, path = line.split("\t")
-                entries.append((path, int(size)))
-
-        # Include individual file sizes if requested
-        if include_files:
-            for root, _, files in os.walk(dir_path):
-                current_depth = root[len(dir_path):].count(os.sep)
-                if current_depth >= depth:
-                    break
-
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        file_size = int(run_command(["stat", "-c", "%s", file_path]))
-                        entries.append((file_path, file_size))
-                    except Exception as e:
-                        entries.append((file_path, f"Error: {e}"))
+        # Scan the top level here and fan the subtrees out over a thread pool;
+        # os.scandir/os.stat release the GIL, so threads overlap the syscalls.
+        total = os.stat(dir_path).st_size
+        subdirs = []
+
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, entry_stat))
+                    else:
+                        total += entry_stat.st_size
+                        if include_files and depth > 0:
+                            entries.append((entry.path, entry_stat.st_size))
+                except OSError as e:
+                    entries.append((entry.path, f"Error: {e}"))
+
+        if subdirs:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                futures = [
+                    (executor.submit(_walk, path, dir_stat, depth - 1, include_files, sub_entries), sub_entries)
+                    for path, dir_stat, sub_entries in ((p, s, []) for p, s in subdirs)
+                ]
+                for future, sub_entries in futures:
+                    total += future.result()
+                    entries.extend(sub_entries)
+
+        entries.append((dir_path, total))
     except Exception as e:
         raise Exception(f"Error listing directory sizes for {dir_path}: {e}")
 
     return entries
 
+
+def _walk(path, dir_stat, depth, include_files, entries):
+    """
+    Recursively accumulate directory totals (and optionally file sizes) in one pass.
+
+    :param path: Path to the directory to scan.
+    :param dir_stat: Stat result of the directory, obtained by the caller.
+    :param depth: Remaining recursion depth (0 reports only the current directory).
+    :param include_files: Whether to also report individual file sizes.
+    :param entries: List collecting tuples (path, size_in_bytes).
+    :return: Total size of the directory in bytes.
+    """
+    # Count the directory inode itself, matching `du --bytes`
+    total = dir_stat.st_size
+
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                # Stat each entry exactly once and reuse the result
+                entry_stat = entry.stat(follow_symlinks=False)
+                if entry.is_dir(follow_symlinks=False):
+                    total += _walk(entry.path, entry_stat, depth - 1, include_files, entries)
+                else:
+                    total += entry_stat.st_size
+                    if include_files and depth > 0:
+                        entries.append((entry.path, entry_stat.st_size))
+            except OSError as e:
+                entries.append((entry.path, f"Error: {e}"))
+
+    if depth >= 0:
+        entries.append((path, total))
+    return total
+
 def _mount_disk_image(file_path, mount_path):
     """
         Mount a disk image in read-only mode using a loop device.
@@ -226,17 +290,21 @@ def _mount_disk_image(file_path, mount_path):
         :raises Exception: If the mounting process fails.
         """
     try:
-        # Ensure the mount point exists or create it
-        if not os.path.exists(mount_path):
-            subprocess.run(["sudo", "mkdir","-p", mount_path], check=True)
-
-        if len(os.listdir(mount_path)) != 0:
-            raise Exception(f"Dir is not empty: {mount_path}")
+        # Ensure the mount point exists and is empty with a single scandir;
+        # the iterator short-circuits after the first entry
+        try:
+            with os.scandir(mount_path) as it:
+                if next(it, None) is not None:
+                    raise Exception(f"Dir is not empty: {mount_path}")
+        except FileNotFoundError:
+            os.makedirs(mount_path)
 
         # Mount the disk image in read-only mode
 
         loop_device = _setup_loop_device(file_path)
-        partitions = _get_partition_info(loop_device)
+        # losetup -P already asked the kernel to probe partitions, so read the
+        # result from sysfs; fall back to parted only if sysfs shows none.
+        partitions = _list_loop_partitions(loop_device) or _get_partition_info(loop_device)
         try:
             click.echo("Available partitions:")
             for idx, partition in enumerate(partitions, start=1):
@@ -245,7 +313,7 @@ def _mount_disk_image(file_path, mount_path):
             _mount_partition(partitions[choice - 1], mount_path)
         except:
             command = ["sudo", "mount", "-o", "ro,noexec", loop_device, mount_path]
-            subprocess.run(command, check=True)
+            subprocess.run(command, check=True, close_fds=False)
             click.echo(f"Disk image {file_path} successfully mounted at {mount_path} in read-only mode.")
 
     except subprocess.CalledProcessError as e:
@@ -264,8 +332,8 @@ def _unmount_disk_image(mount_path):
     try:
         # Unmount the disk image
         command = ["sudo", "umount", mount_path]
-        subprocess.run(command, check=True)
-        subprocess.run(["sudo", "rm","-r", mount_path], check=True)
+        subprocess.run(command, check=True, close_fds=False)
+        shutil.rmtree(mount_path)
         click.echo(f"Disk image successfully unmounted from {mount_path}.")
     except subprocess.CalledProcessError as e:
         raise Exception(f"Error unmounting the disk image: {e.stderr.strip()}")
@@ -283,19 +351,15 @@ def _run_disk_tool(tool, file_path):
     :raises Exception: If the tool fails or is not found.
     """
     try:
-        # Define the commands for each tool
-        commands = {
-            "fdisk": ["fdisk", "-l", file_path],
-            "parted": ["parted", file_path, "print"],
-            "file": ["file", file_path],
-            "disktype": ["disktype", file_path],
-            "ewfinfo": ["ewfinfo", file_path],
-        }
-
-        if tool not in commands:
+        argv = _DISK_TOOL_ARGV.get(tool)
+        if argv is None:
             raise ValueError(f"Unsupported tool: {tool}")
 
-        return run_command(commands[tool])
+        command = [*argv, file_path]
+        if tool == "parted":
+            command.append("print")
+
+        return run_command(command)
     except FileNotFoundError:
         raise Exception(f"Tool '{tool}' is not installed or not in the PATH.")
     except subprocess.CalledProcessError as e:
@@ -317,6 +381,22 @@ def _setup_loop_device(img_file):
     except subprocess.CalledProcessError as e:
         raise Exception(f"Error setting up loop device: {e.stderr.strip()}")
 
+def _list_loop_partitions(loop_device):
+    """
+    Enumerate partition device nodes of a loop device from sysfs.
+
+    :param loop_device: The loop device (e.g., /dev/loop0).
+    :return: List of partitions (e.g., ['/dev/loop0p1']), empty if none found.
+    """
+    device_name = os.path.basename(loop_device)
+    try:
+        with os.scandir(f"/sys/block/{device_name}") as it:
+            names = [entry.name for entry in it if entry.name.startswith(f"{device_name}p")]
+    except OSError:
+        return []
+    return [f"/dev/{name}" for name in sorted(names)]
+
+
 def _get_partition_info(loop_device):
     """
     Retrieve partition information from a loop device.
@@ -326,20 +406,8 @@ def _get_partition_info(loop_device):
     """
     try:
         command = ["sudo", "parted", "-s", loop_device, "print"]
-        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
-        output = result.stdout
-        partitions = []
-        for line in output.splitlines():
-            line = line.strip()
-            if not line or not line[0].isdigit():  # Skip empty lines or lines that don't start with a number
-                continue
-            columns = line.split()
-            if len(columns) < 1:
-                continue
-            partition_number = columns[0]
-            partitions.append(f"{loop_device}p{partition_number}")
-        click.echo(partitions)
-        return partitions
+        result = subprocess.run(command, capture_output=True, text=True, bufsize=-1, check=True, close_fds=False)
+        return [f"{loop_device}p{m.group(1)}" for m in _PART_RE.finditer(result.stdout)]
     except subprocess.CalledProcessError as e:
         raise Exception(f"Error retrieving partition info: {e.stderr.strip()}")
 
@@ -355,7 +423,7 @@ def _mount_partition(partition, mount_point):
         if not os.path.exists(mount_point):
             os.makedirs(mount_point)
         command = ["sudo", "mount", "-o", "ro,noexec", partition, mount_point]
-        subprocess.run(command, check=True)
+        subprocess.run(command, check=True, close_fds=False)
         print(f"Partition {partition} successfully mounted at {mount_point} in read-only mode.")
     except subprocess.CalledProcessError as e:
         raise Exception(f"Error mounting partition: {e.stderr.strip()}")
@@ -371,12 +439,13 @@ def _export_ewf_to_raw(input_files, output_file_name):
         """
     try:
         output_dir = os.path.dirname(output_file_name)  # Extract the directory part of the path
-        if output_dir:  # Check if there's a directory part in the path
+        if output_dir and output_dir not in _MKDIR_CACHE:  # Check if there's a directory part in the path
             os.makedirs(output_dir, exist_ok=True)
+            _MKDIR_CACHE.add(output_dir)
 
         # Construct the ewfexport command
         command = ["ewfexport", "-t", output_file_name, "-f", "raw", "-u"] + input_files
-        subprocess.run(command, check=True)
+        subprocess.run(command, check=True, close_fds=False)
         print(f"EWF disk image {', '.join(input_files)} successfully converted to raw disk image {output_file_name}")
     except subprocess.CalledProcessError as e:
         raise Exception(f"Error running ewfexport: {e.stderr.strip()}")
@@ -1,14 +1,52 @@
+import functools
+import operator
+import re
 import sys
 import os
 import stat
+import subprocess
+import time
 import pwd
 import grp
-from utils.helper import check_path_type, resolve_path, run_command, parse_size_from_string, parse_size_to_string
+from pathlib import PurePath
+from utils.helper import check_path_type, resolve_path, run_command, parse_size_from_string, parse_size_to_string, json_loads, json_dumps
+from utils.exiftool import run_exiftool
+from utils import geocache, metadata_cache
 import click
-import json
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from geopy.geocoders import Nominatim
+from geopy.extra.rate_limiter import RateLimiter
+
+try:
+    import magic
+except ImportError:
+    # python-magic is optional; the file command is the fallback
+    magic = None
+
+# Number of files checked per exiftool invocation in directory scans
+_GPS_BATCH_SIZE = 500
+
+# Number of files per exiftool invocation in full-metadata extraction,
+# kept modest to stay well below ARG_MAX
+_METADATA_BATCH_SIZE = 256
+
+# Precompiled exiftool argument prefixes for the hot helpers, so the batch
+# paths extend an immutable tuple instead of rebuilding list literals
+_EXIFTOOL_GPS_ARGS = ("-fast2", "-n", "-gps:all", "-j")
+_EXIFTOOL_GPS_BATCH_ARGS = ("exiftool", "-fast2", "-gps:all", "-j", "-c", "%.3f")
+_EXIFTOOL_DATES_ARGS = ("-j", "-fast2", "-time:all", "-dateFormat", "%Y:%m:%d %H:%M:%S")
+_EXIFTOOL_DATE_FILTER_ARGS = ("exiftool", "-j", "-fast2", "-dateFormat", "%Y:%m:%d %H:%M:%S")
+
+# File extensions that can plausibly carry GPS metadata; anything else is
+# skipped before exiftool ever sees it
+_GPS_CAPABLE = frozenset({
+    ".jpg", ".jpeg", ".heic", ".heif", ".png", ".webp", ".tiff", ".tif",
+    ".mp4", ".mov", ".m4v", ".3gp", ".avi",
+    ".cr2", ".cr3", ".dng", ".nef", ".arw", ".raf", ".orf", ".rw2",
+})
+
 
 @click.group()
 def module():
@@ -19,59 +57,159 @@ def module():
 
 
 @module.command()
-@click.argument("file_path", type=click.Path())
+@click.argument("file_paths", type=click.Path(), nargs=-1, required=True)
 @click.option("--save-as", type=click.Choice(["json", "xml", "txt"], case_sensitive=False),help="Save metadata as JSON, XML,TXT file.")
 @click.option("--save-to", type=click.Path(), help="Path to save metadata to. Users home dir is default")
+@click.option("--no-cache", is_flag=True, default=False, help="Bypass the on-disk metadata cache.")
+@click.option("--fast/--full", "fast", default=True, help="Skip MakerNotes and trailer scans (default). Use --full to read them.")
 @click.pass_context
-def get_all_metadata(ctx, file_path, save_as: str, save_to: str):
+def get_all_metadata(ctx, file_paths, save_as: str, save_to: str, no_cache: bool, fast: bool):
     """
-    Get all metadata from file. Does not resolve recursive metadata.
+    Get all metadata from one or more files. Does not resolve recursive metadata.
 
-    FILE_PATH is the path to the file to extract metadata from.
+    FILE_PATHS are the paths to the files to extract metadata from.
     """
     try:
         # Validate input paths
-        check_path_type(ctx.obj['workdir'], file_path, has_to_be_file=True)
-        file_path = resolve_path(ctx.obj['workdir'], file_path)
-        if save_to:
-            save_to = resolve_path(ctx.obj['workdir'], save_to)
-            check_path_type(ctx.obj['workdir'], save_to, has_to_be_file=False)
+        resolved_paths, save_to = _validated_paths(ctx, file_paths, save_to)
     except Exception as e:
         click.echo(e)
         sys.exit()
 
-    # Get basic metadata
+    # Ensure save_as is provided if save_to is specified
+    if save_to and not save_as:
+        click.echo("Invalid arguments. Option --save-as is missing")
+        sys.exit()
+
+    # Display-only runs that bypass the cache can echo exiftool's own JSON
+    # bytes directly, skipping the parse and re-serialize round-trip. This
+    # only holds for a single exiftool call: concatenating per-chunk arrays
+    # would not be one valid JSON document, so larger runs take the batch
+    # path below
+    if not save_as and not save_to and no_cache and len(resolved_paths) <= _METADATA_BATCH_SIZE:
+        try:
+            args = ["-j", "-fast2"] if fast else ["-j"]
+            click.echo(run_exiftool([*args, *resolved_paths]).decode(), nl=False)
+        except Exception as e:
+            click.echo(f"Error retrieving metadata: {e}")
+            sys.exit()
+        return
+
+    # Get basic metadata for all files, batching exiftool calls
     try:
-        metadata_raw = run_command(["exiftool", "-j", file_path])
-        metadata = json.loads(metadata_raw)[0]
+        metadata_by_file = _get_all_metadata_batch(resolved_paths, no_cache, fast)
     except Exception as e:
         click.echo(f"Error retrieving metadata: {e}")
         sys.exit()
 
+    items = []
+    for file_path in resolved_paths:
+        metadata = metadata_by_file.get(file_path)
+        if metadata is None:
+            click.echo(f"Error retrieving metadata for: {file_path}")
+            continue
+        items.append((file_path, metadata))
+
     # Print metadata to console if no save options are provided
     if not save_as and not save_to:
-        click.echo(json.dumps(metadata, indent=4))
+        for _, metadata in items:
+            click.echo(json_dumps(metadata))
         return
 
-    # Ensure save_as is provided if save_to is specified
-    if save_to and not save_as:
-        click.echo("Invalid arguments. Option --save-as is missing")
-        sys.exit()
-
     # Resolve save_to or default to the
     save_to_dir = save_to or os.path.expanduser("~")
-    metadata_filename = _generate_metadata_filename(file_path, "metadata_all")
+    save_as_lower = save_as.lower()
+
+    if len(items) > 1:
+        # Serializing and writing each output file is independent work;
+        # a process pool spreads it across cores, and chunksize keeps the
+        # pickling overhead per task amortized
+        worker = functools.partial(_process_one, save_as_lower=save_as_lower, save_to_dir=save_to_dir)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            list(pool.map(worker, items, chunksize=8))
+    else:
+        for item in items:
+            _process_one(item, save_as_lower, save_to_dir)
+
+
+def _process_one(item, save_as_lower, save_to_dir):
+    """
+    Serialize one file's metadata and write it out in the requested format.
+    :param item: Tuple of (file_path, metadata dict).
+    :param save_as_lower: Lowercased output format (json, xml or txt).
+    :param save_to_dir: Directory to write the output file into.
+    """
+    file_path, metadata = item
+    _save_metadata(metadata, file_path, "metadata_all", save_as_lower, save_to_dir)
+
+
+def _save_metadata(metadata, file_path, metadata_type, save_as, save_to):
+    """
+    Shared save path for the metadata commands: resolve the target
+    directory, build the output filename and dispatch to the writer for
+    the requested format.
+    :param metadata: Metadata dict to write.
+    :param file_path: Source file the metadata came from.
+    :param metadata_type: Filename tag (e.g. metadata_all, metadata_gps).
+    :param save_as: Output format (json, xml or txt).
+    :param save_to: Target directory, or None for the user's home.
+    """
+    save_to_dir = save_to or os.path.expanduser("~")
+    save_as_lower = save_as.lower()
+    metadata_filename = _generate_metadata_filename(file_path, metadata_type)
+    save_path = os.path.join(save_to_dir, f"{metadata_filename}.{save_as_lower}")
+    _SAVERS[save_as_lower](metadata, save_path)
+
 
-    # Construct the full save path
-    save_path = os.path.join(save_to_dir, f"{metadata_filename}.{save_as.lower()}")
+def _get_all_metadata_batch(file_paths, no_cache, fast=True):
+    """
+    Extract full metadata for the given files, batching cache misses into
+    shared exiftool invocations so interpreter startup is paid once per
+    chunk instead of once per file.
+    :param file_paths: Resolved paths of the files to process.
+    :param no_cache: If True, skip the on-disk metadata cache.
+    :param fast: If True, pass -fast2 so exiftool skips MakerNotes and
+        trailer scans instead of reading the whole file.
+    :return: Dict mapping file path to its metadata dict.
+    """
+    # Cached entries are fast-mode extractions; a --full run must not be
+    # served from (or stored into) them
+    no_cache = no_cache or not fast
 
-    match save_as.lower():
-        case "json":
-            _save_metadata_as_json(metadata, save_path)
-        case "xml":
-            _save_metadata_as_xml(metadata, save_path)
-        case "txt":
-            _save_metadata_as_txt(metadata, save_path)
+    metadata_by_file = {}
+    misses = []
+    for file_path in file_paths:
+        file_stat = os.stat(file_path)
+        cached = None
+        if not no_cache:
+            cached = metadata_cache.get(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+        if cached is not None:
+            metadata_by_file[file_path] = cached
+        else:
+            misses.append((file_path, file_stat))
+
+    args = ["-j"]
+    if fast:
+        args.append("-fast2")
+
+    for start in range(0, len(misses), _METADATA_BATCH_SIZE):
+        chunk = misses[start:start + _METADATA_BATCH_SIZE]
+        metadata_raw = run_exiftool([*args, *(path for path, _ in chunk)])
+        # Tag names repeat across every file in the batch; interning them
+        # collapses the duplicates to one string object per tag
+        by_source = {}
+        for entry in json_loads(metadata_raw):
+            entry = {sys.intern(key): value for key, value in entry.items()}
+            by_source[entry.get("SourceFile")] = entry
+        for file_path, file_stat in chunk:
+            metadata = by_source.get(file_path)
+            if metadata is None:
+                continue
+            metadata_by_file[file_path] = metadata
+            if not no_cache:
+                metadata_cache.put(file_path, file_stat.st_mtime_ns, file_stat.st_size, metadata)
+
+    return metadata_by_file
 
 @module.command()
 @click.argument("file_path", type=click.Path())
@@ -87,11 +225,8 @@ def get_gps_metadata(ctx, file_path, save_as: str, save_to: str, location: bool)
     """
     try:
         # Validate input paths
-        check_path_type(ctx.obj['workdir'], file_path, has_to_be_file=True)
-        file_path = resolve_path(ctx.obj['workdir'], file_path)
-        if save_to:
-            save_to = resolve_path(ctx.obj['workdir'], save_to)
-            check_path_type(ctx.obj['workdir'], save_to, has_to_be_file=False)
+        resolved, save_to = _validated_paths(ctx, [file_path], save_to)
+        file_path = resolved[0]
     except Exception as e:
         click.echo(e)
         sys.exit()
@@ -103,18 +238,22 @@ def get_gps_metadata(ctx, file_path, save_as: str, save_to: str, location: bool)
         click.echo(f"Error retrieving metadata: {e}")
         sys.exit()
 
+    if metadata is None:
+        click.echo("Error retrieving metadata: No GPS metadata found")
+        sys.exit()
+
         # Add estimated location if the --location flag is used
     if location and "GPSLatitude" in metadata and "GPSLongitude" in metadata:
         try:
             location_info = _estimate_gps_location(metadata)
-            metadata["EstimatedLocation"] = location_info.address if location_info else "Unknown location"
+            metadata["EstimatedLocation"] = location_info or "Unknown location"
         except Exception as e:
             click.echo(f"Error estimating location: {e}")
             metadata["EstimatedLocation"] = "Error in location estimation"
 
         # Print metadata to console if no save options are provided
     if not save_as and not save_to:
-        click.echo(json.dumps(metadata, indent=4))
+        click.echo(json_dumps(metadata))
         return
 
     # Ensure save_as is provided if save_to is specified
@@ -122,20 +261,7 @@ def get_gps_metadata(ctx, file_path, save_as: str, save_to: str, location: bool)
         click.echo("Invalid arguments. Option --save-as is missing")
         sys.exit()
 
-    # Resolve save_to or default to the
-    save_to_dir = save_to or os.path.expanduser("~")
-    metadata_filename = _generate_metadata_filename(file_path, "metadata_gps")
-
-    # Construct the full save path
-    save_path = os.path.join(save_to_dir, f"{metadata_filename}.{save_as.lower()}")
-
-    match save_as.lower():
-        case "json":
-            _save_metadata_as_json(metadata, save_path)
-        case "xml":
-            _save_metadata_as_xml(metadata, save_path)
-        case "txt":
-            _save_metadata_as_txt(metadata, save_path)
+    _save_metadata(metadata, file_path, "metadata_gps", save_as, save_to)
 
 @module.command()
 @click.argument("dir_path", type=click.Path())
@@ -200,10 +326,8 @@ def find_files_by_size(ctx, dir_path, less_than, more_than, between, depth, type
             if min_size > max_size:
                 raise Exception("Invalid input: Minimum size is greater than maximum size.")
 
-            results = _get_size_filtered_results(dir_path, "+", min_size, depth, type)
-            results = [
-                result for result in results if int(run_command(["stat", "-c", "%s", result[0]])) <= max_size
-            ]
+            # Both bounds are checked inline during the walk; no second pass
+            results = _get_size_filtered_results(dir_path, "between", between, depth, type)
         else:
             click.echo("Error: Please provide one of --less-than, --more-than, or --between.")
             return
@@ -434,28 +558,83 @@ def find_files_by_permissions(ctx,dir_path, owner, group, other, all, depth, inc
     except Exception as e:
         click.echo(f"Error: {e}")
 #-------------help functions-------------
+def _validated_paths(ctx, paths, save_to, must_be_file=True):
+    """
+    Shared argument validation for the metadata commands: resolve and
+    type-check each input path and the optional save directory. The
+    underlying helpers are memoized, so a path validated and resolved
+    here is not stat'd again downstream.
+    :param ctx: Click context carrying the working directory.
+    :param paths: Iterable of input paths.
+    :param save_to: Optional save directory, or None.
+    :param must_be_file: Whether the input paths must be regular files.
+    :return: Tuple of (list of resolved paths, resolved save_to or None).
+    :raises BadParameter: If any path fails validation.
+    """
+    workdir = ctx.obj['workdir']
+    resolved = []
+    for path in paths:
+        check_path_type(workdir, path, has_to_be_file=must_be_file)
+        resolved.append(resolve_path(workdir, path))
+    if save_to:
+        save_to = resolve_path(workdir, save_to)
+        check_path_type(workdir, save_to, has_to_be_file=False)
+    return resolved, save_to
+
+
+def _atomic_write_bytes(save_path, data):
+    """
+    Write a pre-serialized payload to save_path atomically: the bytes go to
+    a sibling .tmp file and are renamed into place, so readers never
+    observe a partially written file.
+    """
+    tmp_path = f"{save_path}.tmp"
+    # The buffered writer retries short writes, so the tmp file is always
+    # complete before the rename publishes it
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, save_path)
+
+
 def _save_metadata_as_json(metadata, save_path):
     """
     Save metadata to a JSON file.
     """
     try:
-        with open(save_path, "w") as f:
-            json.dump(metadata, f, indent=4)
+        _atomic_write_bytes(save_path, json_dumps(metadata).encode())
         click.echo(f"Metadata saved as JSON to: {save_path}")
     except Exception as e:
         click.echo(f"Error saving metadata: {e}")
 
+# Characters not allowed in an XML tag name
+_TAG_INVALID_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@functools.lru_cache(maxsize=4096)
+def _safe_tag(key):
+    """
+    Turn an exiftool tag into a valid XML tag name. Illegal characters
+    (colons, slashes, spaces) become underscores and a leading digit is
+    prefixed, so the writer never emits a malformed document.
+    """
+    tag = _TAG_INVALID_RE.sub("_", key)
+    if not tag or tag[0].isdigit():
+        tag = f"_{tag}"
+    return tag
+
+
 def _save_metadata_as_xml(metadata, save_path):
     """
     Save metadata to an XML file.
     """
     try:
-        root = ET.Element("metadata")
-        for key, value in metadata.items():
-            child = ET.SubElement(root, key)
-            child.text = str(value)
-        tree = ET.ElementTree(root)
-        tree.write(save_path)
+        # Metadata is a flat dict, so build the document directly instead of
+        # constructing an ElementTree object graph first
+        body = "".join(
+            f"<{_safe_tag(key)}>{escape(str(value))}</{_safe_tag(key)}>"
+            for key, value in metadata.items()
+        )
+        _atomic_write_bytes(save_path, f"<metadata>{body}</metadata>".encode())
         click.echo(f"Metadata saved as XML to: {save_path}")
     except Exception as e:
         click.echo(f"Error saving metadata: {e}")
@@ -465,114 +644,231 @@ def _save_metadata_as_txt(metadata, save_path):
     Save metadata to a TXT file.
     """
     try:
-        with open(save_path, "w") as f:
-            for key, value in metadata.items():
-                f.write(f"{key}: {value}\n")
+        payload = "".join(f"{key}: {value}\n" for key, value in metadata.items())
+        _atomic_write_bytes(save_path, payload.encode())
         click.echo(f"Metadata saved as TXT to: {save_path}")
     except Exception as e:
         click.echo(f"Error saving metadata: {e}")
 
+
+# Dispatch table for the --save-as formats; a dict lookup replaces the
+# per-file match/case blocks in the commands above
+_SAVERS = {
+    "json": _save_metadata_as_json,
+    "xml": _save_metadata_as_xml,
+    "txt": _save_metadata_as_txt,
+}
+
+
 def _generate_metadata_filename(file_path, metadata_type):
-    base_name = os.path.splitext(os.path.basename(file_path))[0]
-    # Get the current date in YYYYMMDD format
-    current_date = datetime.now().strftime("%Y%m%d%H%M%S")
-    # Combine components
-    return f"{base_name}-{metadata_type}-{current_date}"
+    base_name = PurePath(file_path).stem
+    # A nanosecond timestamp keeps names unique even when a batch exports
+    # several files within the same second
+    return f"{base_name}-{metadata_type}-{time.time_ns()}"
+
+# Geocoder client and its rate-limited reverse call, constructed once on
+# first use
+_GEOLOCATOR = None
+_REVERSE = None
+
 
 def _estimate_gps_location(gps_object):
     latitude = gps_object["GPSLatitude"]
     longitude = gps_object["GPSLongitude"]
-    latitudeReF = gps_object["GPSLatitudeRef"]
-    longitudeRef = gps_object["GPSLongitudeRef"]
 
-    latidute = latitude if latitudeReF == "North" else latitude*(-1)
-    longitude = longitude if longitudeRef == "East" else longitude*(-1)
+    # With -n the refs are single letters ("N"/"S"); sign the coordinates
+    if gps_object.get("GPSLatitudeRef") in ("S", "South"):
+        latitude = -latitude
+    if gps_object.get("GPSLongitudeRef") in ("W", "West"):
+        longitude = -longitude
 
-    geolocator = Nominatim(user_agent="gps_metadata_tool")
-    location_info = geolocator.reverse((latitude, longitude), language="en")
-    return location_info
+    # Round to ~11 m so photos taken at the same spot share a cache entry
+    return _reverse_geocode(round(latitude, 4), round(longitude, 4))
 
-def _get_raw_gps_metadata(file_path):
-    metadata_raw = run_command(["exiftool", "-gps:all", "-j", "-c", "%.3f", file_path])
-    metadata = json.loads(metadata_raw)[0]
 
-    # Check if GPS metadata exists
+@functools.lru_cache(maxsize=1024)
+def _reverse_geocode(latitude, longitude):
+    """
+    Reverse-geocode a coordinate pair into an address string. Results are
+    cached per rounded coordinate both in-process and on disk, so repeated
+    or nearby lookups skip the network round-trip even across runs.
+    :return: The address string, or None if nothing was found.
+    """
+    cached = geocache.get(latitude, longitude)
+    if cached is not None:
+        return cached
+
+    global _GEOLOCATOR, _REVERSE
+    if _GEOLOCATOR is None:
+        _GEOLOCATOR = Nominatim(user_agent="gps_metadata_tool")
+        # Nominatim's usage policy allows one request per second; the rate
+        # limiter only throttles actual cache misses
+        _REVERSE = RateLimiter(_GEOLOCATOR.reverse, min_delay_seconds=1)
+    location = _REVERSE((latitude, longitude), language="en")
+    address = location.address if location else None
+    if address is not None:
+        geocache.put(latitude, longitude, address)
+    return address
+
+def _get_raw_gps_metadata(file_path):
+    # Key the memoized lookup on the file's current state so a changed
+    # file invalidates its entry automatically
+    file_stat = os.stat(file_path)
+    metadata = _get_raw_gps_metadata_cached(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+    # Hand out a copy; callers annotate the dict (EstimatedLocation) and
+    # must not mutate the cached original
+    return dict(metadata) if metadata is not None else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_raw_gps_metadata_cached(file_path, mtime_ns, size):
+    # -fast2 stops reading after the header segments (GPS tags live there)
+    # and -n returns plain numeric values with no formatting work
+    metadata_raw = run_exiftool([*_EXIFTOOL_GPS_ARGS, file_path])
+    metadata = json_loads(metadata_raw)[0]
+
+    # Missing GPS tags are the common case, so signal it with None rather
+    # than paying for an exception per negative file
     if "GPSVersionID" not in metadata and "GPSLatitude" not in metadata:
-        raise Exception("No GPS metadata found")
+        return None
     return metadata
 
+def _iter_files(path, depth):
+    """
+    Recursively yield DirEntry objects for the files under a directory,
+    descending at most depth levels. The DirEntry type checks reuse the
+    data scandir already fetched, so the walk needs no extra stat calls or
+    per-directory depth arithmetic the os.walk loops used to do.
+    :param path: Directory to walk.
+    :param depth: How many directory levels below path to descend into.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth > 0:
+                            yield from _iter_files(entry.path, depth - 1)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
 def _list_files_with_gps_metadata(directory, depth):
     """
     List all files with GPS metadata in a directory up to a given depth.
     :param directory: Path to the directory.
-    :param depth: Depth of recursive search. If None, search is unlimited.
+    :param depth: Depth of recursive search.
     :return: List of file paths with GPS metadata.
     """
+    candidates = []
+    for entry in _iter_files(directory, depth):
+        if os.path.splitext(entry.name)[1].lower() in _GPS_CAPABLE:
+            candidates.append(entry.path)
+
+    # One exiftool invocation per batch instead of one per file, so the
+    # interpreter startup cost is amortized across the whole directory.
+    # Batches are independent, so run them concurrently; the GIL is
+    # released while each thread blocks on its subprocess.
+    chunks = [candidates[i:i + _GPS_BATCH_SIZE] for i in range(0, len(candidates), _GPS_BATCH_SIZE)]
+    if len(chunks) <= 1:
+        return _gps_batch(candidates)
+
     files_with_gps = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for batch_result in executor.map(_gps_batch, chunks):
+            files_with_gps.extend(batch_result)
+    return files_with_gps
 
-    for root, dirs, files in os.walk(directory):
-        # Limit recursion depth if depth is specified
-        if depth is not None:
-            current_depth = root[len(directory):].count(os.sep)
-            if current_depth >= depth:
-                dirs[:] = []  # Do not recurse further
 
-        for file in files:
-            file_path = os.path.join(root, file)
-            try:
-                # Attempt to retrieve GPS metadata
-                _get_raw_gps_metadata(file_path)
-                files_with_gps.append(file_path)  # If no exception, add file to the list
-            except Exception:
-                # Skip files without GPS metadata or on error
-                pass
+def _gps_batch(paths):
+    """
+    Check a batch of files for GPS metadata with a single exiftool call.
+    :param paths: List of file paths to check.
+    :return: List of the paths that carry GPS metadata.
+    """
+    if not paths:
+        return []
 
-    return files_with_gps
+    command = [*_EXIFTOOL_GPS_BATCH_ARGS, *paths]
+    # exiftool exits non-zero if any file in the batch is unreadable but
+    # still emits JSON for the rest, so parse whatever stdout we get.
+    # The output stays bytes; the JSON parser takes it directly.
+    result = subprocess.run(command, capture_output=True, close_fds=False)
+    if not result.stdout:
+        return []
+
+    try:
+        metadata_list = json_loads(result.stdout)
+    except ValueError:
+        return []
+
+    return [
+        entry["SourceFile"] for entry in metadata_list
+        if "GPSVersionID" in entry or "GPSLatitude" in entry
+    ]
 
 
 def _get_size_filtered_results(directory, size_option, size_value, depth, type):
     """
-    Use `find` for files or `du` for directories based on size and include sizes in output.
+    Find files or directories matching a size predicate in one in-process
+    scandir traversal. Directory totals are accumulated bottom-up during
+    the walk, replacing the old find pipeline and its du shell-out per
+    directory with a single linear pass.
     :param directory: Directory to search in.
-    :param size_option: '+' for greater than, '-' for less than.
-    :param size_value: Size in bytes.
+    :param size_option: '+' for greater than, '-' for less than, or
+        'between' for an inclusive range.
+    :param size_value: Size in bytes, or a (min, max) tuple for 'between'.
     :param depth: Maximum depth of recursive search.
     :param type: Search type ('f' for files, 'd' for directories).
     :return: List of tuples (path, size) of matching files or directories.
     """
     results = []
 
-    if type == "f":
-        # Use `find` for files
-        command = ["find", directory, "-maxdepth", str(depth), "-type", "f", "-size", f"{size_option}{size_value}c"]
-        files = run_command(command).splitlines()
-
-        for file_path in files:
-            try:
-                # Get file size in bytes
-                size_bytes = int(run_command(["stat", "-c", "%s", file_path]))
-                results.append((file_path, size_bytes))
-            except Exception as e:
-                click.echo(f"Warning: Could not process file {file_path}: {e}")
-
-    elif type == "d":
-        # Use `find` to list directories, then filter by size using `du`
-        command = ["find", directory, "-maxdepth", str(depth), "-type", "d"]
-        dirs = run_command(command).splitlines()
+    def matches(size):
+        if size_option == "+":
+            return size > size_value
+        if size_option == "-":
+            return size < size_value
+        return size_value[0] <= size <= size_value[1]
+
+    def walk(path, dir_stat, remaining):
+        # Returns the directory's recursive apparent size (du -sb style,
+        # including directory inodes), recording matches along the way
+        total = dir_stat.st_size
+        try:
+            entries = list(os.scandir(path))
+        except OSError as e:
+            click.echo(f"Warning: Could not process directory {path}: {e}")
+            return total
 
-        for dir_path in dirs:
+        for entry in entries:
             try:
-                # Get size of directory in bytes using `du`
-                du_output = run_command(["du", "-sb", dir_path])
-                dir_size = int(du_output.split()[0])  # First column is the size in bytes
-
-                # Check size condition
-                if size_option == "+" and dir_size > size_value:
-                    results.append((dir_path, dir_size))
-                elif size_option == "-" and dir_size < size_value:
-                    results.append((dir_path, dir_size))
-            except Exception as e:
-                click.echo(f"Warning: Could not process directory {dir_path}: {e}")
+                if entry.is_dir(follow_symlinks=False):
+                    # File searches can stop at the depth limit, but
+                    # directory totals need the full subtree
+                    if type == "f" and remaining <= 1:
+                        continue
+                    sub_total = walk(entry.path, entry.stat(follow_symlinks=False), remaining - 1)
+                    if type == "d" and remaining >= 1 and matches(sub_total):
+                        results.append((entry.path, sub_total))
+                    total += sub_total
+                elif entry.is_file(follow_symlinks=False):
+                    size_bytes = entry.stat(follow_symlinks=False).st_size
+                    if type == "f" and remaining >= 1 and matches(size_bytes):
+                        results.append((entry.path, size_bytes))
+                    total += size_bytes
+            except OSError as e:
+                click.echo(f"Warning: Could not process file {entry.path}: {e}")
+
+        return total
+
+    total = walk(directory, os.stat(directory), depth)
+    if type == "d" and matches(total):
+        results.append((directory, total))
 
     return results
 
@@ -586,9 +882,11 @@ def _get_dates_from_file(file_path, date_format, sorted_output):
     :return: List of tuples (key, value).
     """
     try:
-        # Run exiftool to get all time-related metadata
-        metadata_raw = run_command(["exiftool", "-j", "-time:all", "-dateFormat", "%Y:%m:%d %H:%M:%S", file_path])
-        metadata = json.loads(metadata_raw)[0]  # Exiftool outputs a JSON array
+        # Run exiftool to get all time-related metadata through the
+        # persistent daemon instead of spawning a process per file
+        # -fast2 skips trailers and MakerNotes; time tags live in the header
+        metadata_raw = run_exiftool([*_EXIFTOOL_DATES_ARGS, file_path])
+        metadata = json_loads(metadata_raw)[0]  # Exiftool outputs a JSON array
 
         # Filter out GPSTimeStamp and GPSDateStamp
         filtered_metadata = {key: value for key, value in metadata.items() if
@@ -597,39 +895,48 @@ def _get_dates_from_file(file_path, date_format, sorted_output):
         times = []
         for key, raw_time in filtered_metadata.items():
             try:
-                from datetime import datetime
-
                 # Parse the raw time using the default ExifTool format
                 parsed_time = datetime.strptime(raw_time, "%Y:%m:%d %H:%M:%S")
 
                 # Format the time if a custom date format is provided
                 formatted_time = parsed_time.strftime(date_format) if date_format else raw_time
 
-                times.append((key, formatted_time, parsed_time))
+                times.append((parsed_time, key, formatted_time))
             except Exception:
-                # Fallback for non-time-related fields
-                times.append((key, raw_time, None))
+                # Fallback for non-time-related fields; max date sorts last
+                times.append((datetime.max, key, raw_time))
 
-        # Sort results if --sorted is enabled
+        # Sort results if --sorted is enabled; the sort key is precomputed
+        # above, so the comparison needs no per-call conditional
         if sorted_output:
-            times = sorted(
-                times,
-                key=lambda x: x[2] if x[2] else datetime.max  # Use parsed_time or a max date as fallback
-            )
+            times.sort(key=operator.itemgetter(0))
 
-        # Return the final result without parsed_time for cleaner output
-        return [(key, value) for key, value, _ in times]
+        # Return the final result without the sort key for cleaner output
+        return [(key, value) for _, key, value in times]
 
     except Exception as e:
         raise Exception(f"Error processing metadata: {e}")
 
+# In-process libmagic handle, constructed once on first use
+_MAGIC = None
+
+
+@functools.lru_cache(maxsize=4096)
 def _get_file_mime_type(file_path):
     """
-    Determine the file type based on its signature using the 'file' command.
+    Determine the file type based on its signature. Uses in-process libmagic
+    when python-magic is installed, avoiding a fork/exec of the 'file'
+    command per file; otherwise shells out as before. Results are memoized
+    per path for the session, so overlapping scans detect each file once.
     :param file_path: Path to the file.
     :return: Detected file type as a string.
     """
     try:
+        if magic is not None:
+            global _MAGIC
+            if _MAGIC is None:
+                _MAGIC = magic.Magic(mime=True)
+            return _MAGIC.from_file(file_path)
         result = run_command(["file", "--mime-type", "-b", file_path])
         return result.strip()
     except Exception as e:
@@ -648,53 +955,56 @@ def _find_files_by_date(dir_path, date_type, older_than, newer_than, between, fi
     :param depth: Maximum depth for directory traversal.
     :return: List of matching files.
     """
+    candidates = [entry.path for entry in _iter_files(dir_path, depth)]
+
+    # One exiftool call per chunk of candidates instead of one per file;
+    # only the requested date tag is extracted, keeping output small
     matching_files = []
-    for root, dirs, files in os.walk(dir_path):
-        # Apply depth filter
-        current_depth = root[len(dir_path):].count(os.sep)
-        if depth == 0 and current_depth > 0:
-            # Prevent traversal if depth is 0 (only current directory)
-            del dirs[:]
+    for start in range(0, len(candidates), _METADATA_BATCH_SIZE):
+        chunk = candidates[start:start + _METADATA_BATCH_SIZE]
+        command = [*_EXIFTOOL_DATE_FILTER_ARGS, f"-{date_type}", *chunk]
+        # exiftool exits non-zero if any file in the batch is unreadable but
+        # still emits JSON for the rest, so parse whatever stdout we get
+        result = subprocess.run(command, capture_output=True, close_fds=False)
+        if not result.stdout:
+            continue
+        try:
+            metadata_list = json_loads(result.stdout)
+        except ValueError:
             continue
-        if depth is not None and current_depth >= depth:
-            # Prevent os.walk from traversing deeper
-            del dirs[:]
 
-        for file in files:
-            file_path = os.path.join(root, file)
+        for metadata in metadata_list:
+            # Skip files without the specified date type
+            if date_type not in metadata:
+                continue
 
             try:
-                # Get file metadata
-                metadata_raw = run_command(["exiftool", "-j","-dateFormat", "%Y:%m:%d %H:%M:%S",file_path])
-                metadata = json.loads(metadata_raw)[0]
-
-                # Skip files without the specified date type
-                if date_type not in metadata:
-                    continue
-
                 # Parse the date
                 file_date = datetime.strptime(metadata[date_type], "%Y:%m:%d %H:%M:%S")
-
-                # Apply date filters
-                if older_than and file_date >= older_than:
-                    continue
-                if newer_than and file_date <= newer_than:
+            except ValueError:
+                continue
+
+            # Apply date filters
+            if older_than and file_date >= older_than:
+                continue
+            if newer_than and file_date <= newer_than:
+                continue
+            if between and not (between[0] <= file_date <= between[1]):
+                continue
+
+            file_path = metadata["SourceFile"]
+
+            # Check file type if specified
+            if file_type:
+                try:
+                    detected_type = _get_file_mime_type(file_path)
+                except Exception:
                     continue
-                if between and not (between[0] <= file_date <= between[1]):
+                if file_type.lower() not in detected_type.lower():
                     continue
 
-                # Check file type if specified
-                if file_type:
-                    detected_type = _get_file_mime_type(file_path)
-                    if file_type.lower() not in detected_type.lower():
-                        continue
-
-                # File matches all criteria
-                matching_files.append(file_path)
-
-            except Exception as e:
-                pass
-                # click.echo(f"Warning: Skipping file {file_path}: {e}")
+            # File matches all criteria
+            matching_files.append(file_path)
 
     return matching_files
 
@@ -707,39 +1017,52 @@ def _find_files_by_type(dir_path, mime_type, extension, depth):
     :param depth: Maximum depth for directory traversal.
     :return: List of matching files.
     """
-    matching_files = []
-    for root, dirs, files in os.walk(dir_path):
-        # Apply depth filter
-        current_depth = root[len(dir_path):].count(os.sep)
-        if depth == 0 and current_depth > 0:
-            # Prevent traversal if depth is 0 (only current directory)
-            del dirs[:]
+    # Filter on the cheap extension check first so mime detection only ever
+    # runs on files that passed it
+    ext_suffix = f".{extension.lower()}" if extension else None
+    candidates = []
+    for entry in _iter_files(dir_path, depth):
+        if ext_suffix and not entry.name.lower().endswith(ext_suffix):
             continue
-        if depth is not None and current_depth >= depth:
-            # Prevent os.walk from traversing deeper
-            del dirs[:]
+        candidates.append(entry.path)
 
-        for file in files:
-            file_path = os.path.join(root, file)
+    if not mime_type:
+        return candidates
 
-            try:
-                # Check MIME type if specified
-                if mime_type:
-                    detected_mime = _get_file_mime_type(file_path)
-                    if mime_type.lower() not in detected_mime.lower():
-                        continue
+    wanted = mime_type.lower()
+    mime_by_path = _get_mime_types_batch(candidates)
+    return [path for path in candidates if wanted in mime_by_path.get(path, "").lower()]
 
-                # Check file extension if specified
-                if extension and not file.lower().endswith(f".{extension.lower()}"):
-                    continue
-
-                # Add file to results
-                matching_files.append(file_path)
 
+def _get_mime_types_batch(paths):
+    """
+    Detect mime types for many files at once. With python-magic installed
+    the in-process handle is queried per file; otherwise one 'file'
+    invocation covers a whole chunk of paths instead of one fork per file.
+    :param paths: List of file paths.
+    :return: Dict mapping path to detected mime type; unreadable files are
+        simply absent.
+    """
+    if magic is not None:
+        mime_by_path = {}
+        for path in paths:
+            try:
+                mime_by_path[path] = _get_file_mime_type(path)
             except Exception as e:
-                click.echo(f"Warning: Skipping file {file_path}: {e}")
-
-    return matching_files
+                click.echo(f"Warning: Skipping file {path}: {e}")
+        return mime_by_path
+
+    mime_by_path = {}
+    for start in range(0, len(paths), _METADATA_BATCH_SIZE):
+        chunk = paths[start:start + _METADATA_BATCH_SIZE]
+        # Output is one 'path\0: mime' record per line
+        result = subprocess.run(["file", "--mime-type", "--print0", *chunk],
+                                capture_output=True, text=True, close_fds=False)
+        for line in result.stdout.splitlines():
+            path, sep, rest = line.partition("\0")
+            if sep:
+                mime_by_path[path] = rest.lstrip(": ").strip()
+    return mime_by_path
 
 def _get_file_info(file_path, human=False, include_owner=False, include_group=False, include_number=False):
     """
@@ -4,19 +4,33 @@ import json
 # Define the relative path for the configuration file
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../config.json")
 
+# Cached (mtime_ns, config) of the last successful load
+_config_cache = None
+
 def load_config():
     """
     Load the configuration from the project-relative config file.
     Handle cases where the file is missing, empty, or invalid.
+    The parsed config is cached and reused until the file's mtime changes.
     """
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            # Log the issue and recreate a valid default config
-            return recreate_default_config()
-    return recreate_default_config()
+    global _config_cache
+    try:
+        mtime_ns = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return recreate_default_config()
+
+    if _config_cache is not None and _config_cache[0] == mtime_ns:
+        return _config_cache[1]
+
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            config = json.load(f)
+    except json.JSONDecodeError:
+        # Log the issue and recreate a valid default config
+        return recreate_default_config()
+
+    _config_cache = (mtime_ns, config)
+    return config
 
 def recreate_default_config():
     """
@@ -30,8 +44,10 @@ def save_config(config):
     """
     Save the configuration to the project-relative config file.
     """
+    global _config_cache
     with open(CONFIG_FILE, "w") as f:
         json.dump(config, f, indent=4)
+    _config_cache = (os.stat(CONFIG_FILE).st_mtime_ns, config)
 
 def set_working_directory(path):
     """
@@ -0,0 +1,83 @@
+import atexit
+import subprocess
+import threading
+
+
+class ExifToolDaemon:
+    """
+    Persistent exiftool process using -stay_open batch mode.
+
+    A single Perl interpreter is started on first use; every later request
+    only writes arguments to its stdin and reads the response up to the
+    {ready} sentinel, instead of paying a full exiftool launch per call.
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _ensure_process(self):
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["exiftool", "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
+            )
+        return self._process
+
+    def run(self, args):
+        """
+        Execute one exiftool command in the daemon and return its output.
+
+        The pipes stay binary so JSON output can be handed to the parser
+        without an intermediate UTF-8 decode.
+
+        :param args: List of exiftool arguments (tags, options, file paths).
+        :return: The command's stdout as bytes.
+        """
+        with self._lock:
+            process = self._ensure_process()
+            process.stdin.write(("\n".join(args) + "\n-execute\n").encode())
+            process.stdin.flush()
+
+            output_lines = []
+            while True:
+                line = process.stdout.readline()
+                if not line:
+                    raise Exception("exiftool daemon terminated unexpectedly")
+                if line.startswith(b"{ready}"):
+                    break
+                output_lines.append(line)
+            return b"".join(output_lines)
+
+    def close(self):
+        """Shut the daemon down cleanly, killing it if it does not exit."""
+        if self._process is not None and self._process.poll() is None:
+            try:
+                self._process.stdin.write(b"-stay_open\nFalse\n")
+                self._process.stdin.flush()
+                self._process.wait(timeout=5)
+            except Exception:
+                self._process.kill()
+        self._process = None
+
+
+def run_exiftool(args):
+    """
+    Run exiftool with the given arguments through the persistent daemon.
+
+    :param args: List of exiftool arguments, without the leading 'exiftool'.
+    :return: The command's stdout as bytes.
+    """
+    return ExifToolDaemon.instance().run(args)
@@ -0,0 +1,54 @@
+import os
+import sqlite3
+import time
+
+from utils.metadata_cache import CACHE_DIR
+
+# On-disk cache of reverse-geocode lookups, keyed by coordinates quantized
+# to 4 decimals (~11 m grid); Nominatim answers for the same cell are
+# served locally instead of paying a network round-trip per file
+CACHE_FILE = os.path.join(CACHE_DIR, "geocode.sqlite")
+
+# Cached addresses are considered fresh for 24 hours
+TTL_SECONDS = 24 * 60 * 60
+
+_connection = None
+
+
+def _connect():
+    global _connection
+    if _connection is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _connection = sqlite3.connect(CACHE_FILE)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            "lat_q REAL, lon_q REAL, address TEXT, ts INTEGER, "
+            "PRIMARY KEY(lat_q, lon_q))"
+        )
+    return _connection
+
+
+def get(lat_q, lon_q):
+    """
+    Return the cached address for a quantized coordinate pair, or None if
+    there is no entry or the entry is older than the TTL.
+    """
+    row = _connect().execute(
+        "SELECT address, ts FROM geocode WHERE lat_q=? AND lon_q=?",
+        (lat_q, lon_q),
+    ).fetchone()
+    if row is None or time.time() - row[1] > TTL_SECONDS:
+        return None
+    return row[0]
+
+
+def put(lat_q, lon_q, address):
+    """
+    Store the address for a quantized coordinate pair.
+    """
+    connection = _connect()
+    connection.execute(
+        "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?)",
+        (lat_q, lon_q, address, int(time.time())),
+    )
+    connection.commit()
@@ -1,18 +1,45 @@
+import functools
+import json
+import re
+import stat
 import subprocess
 import os
 import click
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize an object to indented JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=4)
+
 def run_command(command):
     """Run a shell command and return the output."""
-    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    result = subprocess.run(command, capture_output=True, text=True, bufsize=-1, close_fds=False)
     if result.returncode != 0:
         raise Exception(f"Command failed: {result.stderr}")
     return result.stdout.strip()
 
 
+@functools.lru_cache(maxsize=4096)
 def resolve_path(ctx_path, path):
     """
     Resolve a given path relative to the current working directory.
+    Results are memoized per (ctx_path, path) pair, so batch commands that
+    resolve the same arguments repeatedly skip the path arithmetic.
 
     :param path: The input path to resolve.
     :param ctx_path: The current working directory to resolve relative paths.
@@ -26,9 +53,12 @@ def resolve_path(ctx_path, path):
         return os.path.abspath(os.path.join(ctx_path, path))
 
 
+@functools.lru_cache(maxsize=4096)
 def check_path_type(ctx_path, path, has_to_be_file):
     """
         Determine if the given path is a file or a directory after resolving it.
+        Successful checks are memoized per invocation; failures raise fresh
+        and are never cached by lru_cache.
         :param ctx_path: Context of the current working directory .
         :param path: Path to check.
         :param has_to_be_file: Boolean to determine if the path is a file or a directory.
@@ -36,55 +66,62 @@ def check_path_type(ctx_path, path, has_to_be_file):
     """
     resolved_path = resolve_path(ctx_path, path)
 
-    if not os.path.exists(resolved_path):
+    # One stat call covers existence and type; exists/isfile/isdir would
+    # each stat the path again
+    try:
+        mode = os.stat(resolved_path).st_mode
+    except OSError:
         raise click.BadParameter(f"Invalid path: {resolved_path}")
 
-    if not has_to_be_file and os.path.isfile(resolved_path):
+    if not has_to_be_file and stat.S_ISREG(mode):
         raise click.BadParameter(f"Given path is not a directory: {resolved_path}")
 
-    elif has_to_be_file and os.path.isdir(resolved_path):
+    elif has_to_be_file and stat.S_ISDIR(mode):
         raise click.BadParameter(f"Given path is not a file: {resolved_path}")
 
 
+# Size strings like '64 MB' or '24,5 mb'; the alternation is ordered
+# longest-first so 'b' cannot shadow 'kb'
+_SIZE_RE = re.compile(r"^\s*([\d.]+)\s*(tb|gb|mb|kb|b)\s*$")
+_SIZE_UNITS = {
+    "tb": 1024 ** 4,
+    "gb": 1024 ** 3,
+    "mb": 1024 ** 2,
+    "kb": 1024,
+    "b": 1
+}
+
+
 def parse_size_from_string(size_str):
     """
     Parse a human-readable size string (e.g., '64 MB', '24,5 MB') into bytes.
+    One precompiled regex apply replaces the old per-unit endswith loop.
     :param size_str: Size string to parse.
     :return: Size in bytes as an integer.
     """
-    units = {
-        "tb": 1024 ** 4,
-        "gb": 1024 ** 3,
-        "mb": 1024 ** 2,
-        "kb": 1024,
-        "b": 1
-    }
-
-    size_str = size_str.strip().lower().replace(",", ".")  # Normalize input
-    for unit in units:
-        if size_str.endswith(unit):
-            try:
-                # Remove the unit from the string and convert to a float
-                numeric_part = size_str.removesuffix(unit)
-                value = float(numeric_part)
-                return int(value * units[unit])
-            except ValueError:
-                raise ValueError(f"Invalid size value: {size_str}")
-    raise ValueError(f"Unknown size unit in: {size_str}")
+    match = _SIZE_RE.match(size_str.lower().replace(",", "."))  # Normalize input
+    if not match:
+        raise ValueError(f"Unknown size unit in: {size_str}")
+    try:
+        value = float(match.group(1))
+    except ValueError:
+        raise ValueError(f"Invalid size value: {size_str}")
+    return int(value * _SIZE_UNITS[match.group(2)])
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_size_to_string(size_bytes):
     """
         Convert size in bytes to a human-readable format.
+        Memoized, since listings repeat the same sizes (empty files,
+        common block sizes) many times. The unit comes straight from the
+        bit length of the value, so there is no divide-and-compare loop.
         :param size_bytes: Size in bytes.
         :return: Formatted size string (e.g., '100 MB', '1.5 GB').
         """
-    units = ["B", "KB", "MB", "GB", "TB"]
-    size = float(size_bytes)
-    unit_index = 0
-
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    if size_bytes <= 0:
+        return "0.0 B"
 
-    return f"{size:.1f} {units[unit_index]}"
+    unit_index = min((size_bytes.bit_length() - 1) // 10, 4)
+    size = size_bytes / (1 << (unit_index * 10))
+    return f"{size:.1f} {('B', 'KB', 'MB', 'GB', 'TB')[unit_index]}"
@@ -0,0 +1,47 @@
+import os
+import sqlite3
+
+from utils.helper import json_loads, json_dumps
+
+# On-disk cache of parsed exiftool metadata, keyed by (path, mtime_ns, size)
+# so entries invalidate themselves whenever the file changes
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "datascribe")
+CACHE_FILE = os.path.join(CACHE_DIR, "metadata.sqlite")
+
+_connection = None
+
+
+def _connect():
+    global _connection
+    if _connection is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _connection = sqlite3.connect(CACHE_FILE)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "path TEXT, mtime_ns INTEGER, size INTEGER, data TEXT, "
+            "PRIMARY KEY(path, mtime_ns, size))"
+        )
+    return _connection
+
+
+def get(path, mtime_ns, size):
+    """
+    Return the cached metadata dict for this file state, or None on a miss.
+    """
+    row = _connect().execute(
+        "SELECT data FROM metadata WHERE path=? AND mtime_ns=? AND size=?",
+        (path, mtime_ns, size),
+    ).fetchone()
+    return json_loads(row[0]) if row else None
+
+
+def put(path, mtime_ns, size, metadata):
+    """
+    Store the metadata dict for this file state.
+    """
+    connection = _connect()
+    connection.execute(
+        "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?)",
+        (path, mtime_ns, size, json_dumps(metadata)),
+    )
+    connection.commit()